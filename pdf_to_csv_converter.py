@@ -5,16 +5,27 @@ PDF to CSV Converter - Optimized version with header skipping
 
 import argparse
 import csv
+import gc
+import heapq
+import io
 import logging
+import os
 import sys
+from collections import Counter
+from concurrent.futures import (Executor, FIRST_COMPLETED, Future, ProcessPoolExecutor,
+                                ThreadPoolExecutor, wait)
 from pathlib import Path
-from typing import List, Tuple, Optional, Iterator
+from typing import Callable, Dict, Generator, List, Tuple, Optional, Iterator, Sequence
 import re
-from dataclasses import dataclass
 from enum import Enum
+from itertools import chain, islice
 
 try:
     import pdfplumber
+    from pdfminer.converter import TextConverter
+    from pdfminer.layout import LAParams
+    from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+    from pdfminer.pdfpage import PDFPage
 except ImportError:
     print("Error: pdfplumber is required. Install with: pip install pdfplumber")
     sys.exit(1)
@@ -25,6 +36,87 @@ except ImportError:
     tqdm = None
 
 
+# Pages handed to a worker in one go; pdfplumber is re-opened per batch
+DEFAULT_BATCH_SIZE = 200
+
+# Header text detection: any character past U+0600 (Arabic and beyond),
+# matched in C instead of an ord() loop over every character
+ARABIC_RE = re.compile(r'[^\x00-\u0600]')
+
+# Lines that can hold data for column detection: no leading '*' and no
+# Arabic text anywhere in the line
+DATA_LINE_RE = re.compile(r'(?!\*)[^\u0601-\U0010ffff]*\Z')
+
+# A processed chunk: its rows and its valid, invalid and skipped counts
+ChunkResult = Tuple[List[Sequence[str]], int, int, int]
+
+# Output buffer for the CSV file, so rows reach disk in large writes
+WRITE_BUFFER_SIZE = 1 << 20
+
+# pdfminer layout parameters for --fast-text: enough analysis to break text
+# into lines, without the vertical-text and figure-text passes
+FAST_TEXT_LAPARAMS = {'detect_vertical': False, 'all_texts': False}
+
+
+def parse_page_ranges(spec: str) -> List[range]:
+    """Parse a page selection like '1-50,100,200-250' into sorted 1-based page ranges
+    
+    Ranges are merged where they overlap but never expanded, so a wide
+    selection costs nothing until it is matched against the document.
+    """
+    ranges: List[range] = []
+    for part in spec.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        first, _, last = part.partition('-')
+        try:
+            start = int(first)
+            end = int(last) if last else start
+        except ValueError:
+            raise ValueError(f"Invalid page range: {part}") from None
+        if start < 1 or end < start:
+            raise ValueError(f"Invalid page range: {part}")
+        ranges.append(range(start, end + 1))
+    
+    if not ranges:
+        raise ValueError(f"No pages selected: {spec}")
+    
+    ranges.sort(key=lambda pages: pages.start)
+    merged = [ranges[0]]
+    for pages in ranges[1:]:
+        if pages.start <= merged[-1].stop:
+            merged[-1] = range(merged[-1].start, max(merged[-1].stop, pages.stop))
+        else:
+            merged.append(pages)
+    
+    return merged
+
+
+def format_plain_rows(rows: Sequence[Sequence[str]], num_columns: int) -> Optional[str]:
+    """Render rows as CSV text without csv.writer's per-field quoting checks
+    
+    Every row must have exactly num_columns fields. Returns None when any
+    field would need quoting (a comma, quote or line break inside a value),
+    in which case the caller falls back to csv.writer.
+    """
+    if num_columns < 2:
+        # csv.writer quotes a lone empty field; leave single columns to it
+        return None
+    if not rows:
+        return ''
+    
+    text = '\r\n'.join(map(','.join, rows)) + '\r\n'
+    
+    # Plain rows contribute exactly num_columns - 1 commas and one CRLF each
+    count = len(rows)
+    if ('"' in text or text.count(',') != count * (num_columns - 1)
+            or text.count('\n') != count or text.count('\r') != count):
+        return None
+    
+    return text
+
+
 class ExtractionMethod(Enum):
     """Supported extraction methods"""
     AUTO = "auto"
@@ -33,16 +125,6 @@ class ExtractionMethod(Enum):
     TABLE = "table"
 
 
-@dataclass
-class DataRecord:
-    """Data structure for extracted records"""
-    values: List[str]
-    
-    def validate(self) -> bool:
-        """Basic validation - all values should be non-empty"""
-        return all(val and val.strip() for val in self.values)
-
-
 class PDFToCSVConverter:
     """Main converter class for PDF to CSV extraction"""
     
@@ -55,25 +137,36 @@ class PDFToCSVConverter:
                  interactive: bool = False,
                  column_names: Optional[List[str]] = None,
                  num_columns: Optional[int] = None,
-                 skip_rows: int = 0):
+                 skip_rows: int = 0,
+                 workers: int = 1,
+                 batch_size: int = DEFAULT_BATCH_SIZE,
+                 fast_text: bool = False,
+                 threads: Optional[int] = None,
+                 pages: Optional[Sequence[range]] = None,
+                 row_validator: Callable[[Sequence[str]], bool] = all):
         self.input_path = Path(input_path)
         self.output_path = Path(output_path)
         self.method = method
         self.validate = validate
+        self.row_validator = row_validator
         self.verbose = verbose
         self.interactive = interactive
         self.column_names = column_names or []
         self.num_columns = num_columns or 3
         self.skip_rows = skip_rows
+        self.workers = max(1, workers)
+        self.batch_size = max(1, batch_size)
+        self.fast_text = fast_text
+        self.threads = max(0, threads or 0)
+        self.pages = pages or None
         
-        # Setup logging
-        log_level = logging.DEBUG if verbose else logging.INFO
-        logging.basicConfig(
-            level=log_level,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
+        # Page text already extracted for sampling, keyed by 1-based page number
+        self._sampled_text: Dict[int, str] = {}
+        
+        # Setup logging - handlers are configured by the application (see main)
         self.logger = logging.getLogger(__name__)
+        if verbose:
+            self.logger.setLevel(logging.DEBUG)
         
         # Statistics
         self.total_records = 0
@@ -86,147 +179,236 @@ class PDFToCSVConverter:
         lines = text.strip().split('\n')
         
         # Skip header lines if they contain Arabic or non-data patterns
-        data_lines = []
-        for line in lines:
-            # Skip lines that appear to be headers (contain Arabic, stars, etc.)
-            if not any(ord(c) > 1536 for c in line) and not line.startswith('*'):
-                tokens = line.strip().split()
-                if tokens:
-                    data_lines.append(tokens)
-        
-        if not data_lines:
-            return 3
+        data_lines = map(str.split, filter(DATA_LINE_RE.match, lines))
         
-        # Count most common number of tokens per line
-        token_counts = {}
-        for tokens in data_lines[:20]:  # Sample first 20 data lines
-            count = len(tokens)
-            if 2 <= count <= 10:  # Reasonable column range
-                token_counts[count] = token_counts.get(count, 0) + 1
+        # Count most common number of tokens per line, sampling the first
+        # 20 data lines only - the rest of the page is never tokenized
+        token_counts = Counter(
+            len(tokens) for tokens in islice(filter(None, data_lines), 20)
+            if 2 <= len(tokens) <= 10  # Reasonable column range
+        )
         
         if token_counts:
             # Return most common count
-            return max(token_counts, key=token_counts.get)
+            most_common_count, _ = token_counts.most_common(1)[0]
+            return most_common_count
         
         return 3  # Default
     
     def get_column_names_interactive(self, num_columns: int) -> List[str]:
         """Interactively get column names from user"""
-        print(f"\nDetected {num_columns} columns in your data.")
-        print("Please provide names for each column:")
-        
-        column_names = []
-        for i in range(num_columns):
-            name = input(f"  Column {i+1} name: ").strip()
-            column_names.append(name or f"Column_{i+1}")
-        
-        print("\nColumn names set to:", ", ".join(column_names))
-        if input("Confirm? (y/n): ").lower() != 'y':
-            return self.get_column_names_interactive(num_columns)
-        
-        return column_names
+        column_names: List[str] = []
+        while True:
+            print(f"\nDetected {num_columns} columns in your data.")
+            print("Please provide names for each column:")
+            
+            # On a retry, pressing Enter keeps the name given last time
+            previous = column_names
+            column_names = []
+            for i in range(num_columns):
+                if previous:
+                    name = input(f"  Column {i+1} name [{previous[i]}]: ").strip()
+                    column_names.append(name or previous[i])
+                else:
+                    name = input(f"  Column {i+1} name: ").strip()
+                    column_names.append(name or f"Column_{i+1}")
+            
+            print("\nColumn names set to:", ", ".join(column_names))
+            if input("Confirm? (y/n): ").lower() == 'y':
+                return column_names
     
-    def extract_data(self, text: str) -> List[DataRecord]:
+    def tokenize(self, text: str) -> List[str]:
+        """Split page text into whitespace-separated tokens"""
+        return text.split()
+    
+    def extract_data(self, text: str) -> List[Sequence[str]]:
         """Extract data from text - unified method"""
-        records = []
+        # All text methods share the token path; ASCII pages skip the Arabic checks
+        return self.extract_structured_data(self.tokenize(text), check_arabic=not text.isascii())
+    
+    def extract_structured_data(self, tokens: List[str], check_arabic: bool = True) -> List[Sequence[str]]:
+        """Extract rows from tokens, skipping Arabic header text"""
+        has_arabic = ARABIC_RE.search
+        nc = self.num_columns
         
-        if self.method == ExtractionMethod.REGEX:
-            # Regex pattern for space-separated values
-            pattern = re.compile(r'\s*'.join([r'(\S+)' for _ in range(self.num_columns)]))
-            matches = pattern.findall(text)
-            
-            for i, match in enumerate(matches):
-                # Skip first N matches if skip_rows is set
-                if i < self.skip_rows:
-                    self.rows_skipped += 1
-                    continue
-                    
-                record = DataRecord(values=list(match))
-                if not self.validate or record.validate():
-                    records.append(record)
-                    self.valid_records += 1
+        # Skip first N records worth of tokens, stepping over Arabic header
+        # tokens until the first data token
+        skip_tokens = self.skip_rows * nc
+        start_idx = 0
+        if check_arabic:
+            while start_idx < len(tokens):
+                if has_arabic(tokens[start_idx]):
+                    start_idx += 1
+                elif skip_tokens > 0:
+                    start_idx += 1
+                    skip_tokens -= 1
                 else:
-                    self.invalid_records += 1
+                    break
         else:
-            # Token-based extraction
-            tokens = text.split()
-            
-            # Skip tokens that are likely headers (Arabic text)
-            start_idx = 0
-            if self.skip_rows > 0:
-                # Skip first N records worth of tokens
-                skip_tokens = self.skip_rows * self.num_columns
-                while start_idx < len(tokens) and skip_tokens > 0:
-                    # Skip Arabic tokens
-                    if any(ord(c) > 1536 for c in tokens[start_idx]):
-                        start_idx += 1
-                    else:
-                        start_idx += 1
-                        skip_tokens -= 1
-                self.rows_skipped = self.skip_rows
-            
-            # Extract records
-            for i in range(start_idx, len(tokens) - self.num_columns + 1, self.num_columns):
-                values = tokens[i:i + self.num_columns]
-                
-                # Skip if values contain Arabic text
-                if any(any(ord(c) > 1536 for c in val) for val in values):
-                    continue
-                
-                record = DataRecord(values=values)
-                if not self.validate or record.validate():
-                    records.append(record)
-                    self.valid_records += 1
-                else:
-                    self.invalid_records += 1
+            start_idx = skip_tokens
+        if self.skip_rows > 0:
+            self.rows_skipped = self.skip_rows
         
-        return records
-    
-    def process_page(self, page) -> List[DataRecord]:
-        """Process a single PDF page"""
-        records = []
+        # zip over one shared iterator reshapes the token stream into
+        # num_columns-wide rows, dropping any partial tail, and filter()
+        # validates them - with the default all() the whole pipeline runs in C
+        rows: List[Sequence[str]] = list(zip(*[islice(tokens, start_idx, None)] * nc))
+        if check_arabic:
+            # Arabic inside the data drops its whole row, not just the token,
+            # so the rows after it stay aligned
+            rows = [values for values in rows if not any(map(has_arabic, values))]
+        if self.validate:
+            checked = len(rows)
+            rows = list(filter(self.row_validator, rows))
+            self.invalid_records += checked - len(rows)
         
-        if self.method == ExtractionMethod.TABLE:
-            tables = page.extract_tables()
+        self.valid_records += len(rows)
+        return rows
+    
+    def extract_table_data(self, tables: List[List[List[Optional[str]]]]) -> Iterator[Sequence[str]]:
+        """Extract rows from pdfplumber tables, skipping Arabic header rows"""
+        has_arabic = ARABIC_RE.search
+        nc = self.num_columns
+        skip_rows = self.skip_rows
+        validate = self.validate
+        is_valid = self.row_validator
+        valid = invalid = 0
+        try:
             for table in tables:
                 for i, row in enumerate(table):
-                    if i < self.skip_rows:
+                    if i < skip_rows:
                         self.rows_skipped += 1
                         continue
                         
-                    if len(row) >= self.num_columns:
-                        values = [str(row[j]).strip() for j in range(self.num_columns)]
+                    if len(row) >= nc:
+                        # pdfplumber gives None for merged or missing cells
+                        values = [cell.strip() if cell else '' for cell in row[:nc]]
                         
                         # Skip if contains Arabic
-                        if any(any(ord(c) > 1536 for c in val) for val in values):
+                        if any(map(has_arabic, values)):
                             continue
                             
-                        record = DataRecord(values=values)
-                        if not self.validate or record.validate():
-                            records.append(record)
-                            self.valid_records += 1
+                        # Cells are already stripped above
+                        if not validate or is_valid(values):
+                            yield values
+                            valid += 1
                         else:
-                            self.invalid_records += 1
+                            invalid += 1
+        finally:
+            self.valid_records += valid
+            self.invalid_records += invalid
+    
+    def process_page(self, page) -> Iterator[Sequence[str]]:
+        """Process a single PDF page, yielding rows as they are extracted"""
+        if self.method == ExtractionMethod.TABLE:
+            yield from self.extract_table_data(page.extract_tables())
         else:
-            text = page.extract_text()
-            if text:
-                records = self.extract_data(text)
+            text = self._sampled_text.pop(page.page_number, None)
+            if text is None:
+                text = page.extract_text()
+            rows = self._rows_from_text(text)
+            if rows is None:
+                yield from self.extract_table_data(page.extract_tables())
+            else:
+                yield from rows
+    
+    def _rows_from_text(self, text: Optional[str]) -> Optional[List[Sequence[str]]]:
+        """Extract a page's rows from its text, or None when Auto should try tables
         
-        return records
+        Auto only pays for the table parse when the text found no rows. The
+        text pass's skipped and invalid counts are then undone, so only the
+        rows of the table pass are counted.
+        """
+        counts = self.invalid_records, self.rows_skipped
+        rows = self.extract_data(text) if text else []
+        if not rows and self.method == ExtractionMethod.AUTO:
+            self.invalid_records, self.rows_skipped = counts
+            return None
+        return rows
+
+    def _run_tasks(self, executor: Executor, window: int, tasks: List[tuple],
+                   chunks: List[List[int]], progress) -> Generator[ChunkResult, None, None]:
+        """Yield chunk results in page order, updating progress as workers finish"""
+        pending: Dict[Future, int] = {}
+        submitted = 0
+        
+        # Chunks can finish out of order; hold them back until their turn.
+        # Only `window` chunks past the next one to write are submitted, so
+        # a slow chunk can't pile every later result up here, and each
+        # future is dropped once collected so its rows are freed when written
+        finished: List[Tuple[int, ChunkResult]] = []
+        next_index = 0
+        try:
+            while next_index < len(tasks):
+                while submitted < len(tasks) and submitted < next_index + window:
+                    pending[executor.submit(_process_chunk, tasks[submitted])] = submitted
+                    submitted += 1
+                
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = pending.pop(future)
+                    heapq.heappush(finished, (index, future.result()))
+                    if progress:
+                        progress.update(len(chunks[index]))
+                
+                while finished and finished[0][0] == next_index:
+                    yield heapq.heappop(finished)[1]
+                    next_index += 1
+        finally:
+            # On a failure, don't let the executor run the queued chunks first
+            for future in pending:
+                future.cancel()
+    
+    def _run_inline(self, tasks: List[tuple], chunks: List[List[int]], progress) -> Iterator[ChunkResult]:
+        """Yield chunk results computed in this process, one chunk at a time"""
+        for task, chunk in zip(tasks, chunks):
+            yield _process_chunk(task)
+            if progress:
+                progress.update(len(chunk))
+    
+    def _write_results(self, csvfile, writer, results) -> None:
+        """Write chunk results in page order and fold their statistics in"""
+        for rows, valid, invalid, skipped in results:
+            text = format_plain_rows(rows, self.num_columns)
+            if text is None:
+                writer.writerows(rows)
+            else:
+                csvfile.write(text)
+            csvfile.flush()
+            self.total_records += len(rows)
+            self.valid_records += valid
+            self.invalid_records += invalid
+            self.rows_skipped += skipped
     
     def convert(self) -> Tuple[int, int]:
         """Main conversion method"""
-        self.logger.info(f"Starting conversion: {self.input_path} -> {self.output_path}")
+        self.logger.info("Starting conversion: %s -> %s", self.input_path, self.output_path)
         
         try:
             with pdfplumber.open(self.input_path) as pdf:
-                self.total_pages = len(pdf.pages)
-                self.logger.info(f"Processing {self.total_pages} pages")
+                pages = pdf.pages
+                if self.pages:
+                    pages = [page for page in pages if any(page.page_number in selected for selected in self.pages)]
+                    last_page = len(pdf.pages)
+                    if not pages:
+                        raise ValueError(f"None of the selected pages exist; the document has {last_page} pages")
+                    if max(selected.stop for selected in self.pages) - 1 > last_page:
+                        self.logger.warning("Skipping selected pages past page %d, the last page of the document",
+                                            last_page)
+                
+                page_numbers = [page.page_number for page in pages]
+                self.total_pages = len(page_numbers)
+                self.logger.info("Processing %d pages", self.total_pages)
                 
                 # Interactive mode for column detection
                 if self.interactive and not self.column_names:
-                    if pdf.pages:
-                        sample_text = pdf.pages[0].extract_text()
+                    if pages:
+                        if self.fast_text and self.method != ExtractionMethod.TABLE:
+                            sample_text = next(_extract_text_fast(str(self.input_path), page_numbers[:1]), '')
+                        else:
+                            sample_text = pages[0].extract_text()
+                        # Reused when the page is processed instead of extracting it again
+                        self._sampled_text[page_numbers[0]] = sample_text
                         if sample_text:
                             print("\nAnalyzing PDF structure...")
                             detected_cols = self.detect_columns(sample_text)
@@ -241,37 +423,146 @@ class PDFToCSVConverter:
                 if not self.column_names:
                     self.column_names = [f"Column_{i+1}" for i in range(self.num_columns)]
                 
-                # Process PDF
-                with open(self.output_path, 'w', newline='', encoding='utf-8') as csvfile:
-                    writer = csv.writer(csvfile)
-                    writer.writerow(self.column_names)
-                    
-                    pages = tqdm(pdf.pages, desc="Processing pages", unit="page") if tqdm else pdf.pages
-                    
-                    for page_num, page in enumerate(pages):
-                        # Only skip rows on first page
-                        if page_num > 0:
-                            self.skip_rows = 0
-                            
-                        records = self.process_page(page)
-                        for record in records:
-                            writer.writerow(record.values)
-                            self.total_records += 1
+            # Split pages into chunks, spreading them over every worker but
+            # never exceeding the batch size that bounds memory
+            parallelism = self.threads or self.workers
+            batch = min(self.batch_size, max(1, -(-self.total_pages // parallelism)))
+            chunks = [page_numbers[i:i + batch] for i in range(0, self.total_pages, batch)]
+            options = {
+                'method': self.method,
+                'validate': self.validate,
+                'row_validator': self.row_validator,
+                'column_names': self.column_names,
+                'num_columns': self.num_columns,
+                'fast_text': self.fast_text,
+            }
+            tasks = []
+            for index, chunk in enumerate(chunks):
+                # Only skip rows on first page
+                skip_rows = self.skip_rows if index == 0 else 0
+                sampled = {n: self._sampled_text[n] for n in chunk if n in self._sampled_text}
+                tasks.append((str(self.input_path), chunk, dict(options, skip_rows=skip_rows), sampled))
+            
+            # Process PDF
+            with open(self.output_path, 'w', newline='', encoding='utf-8',
+                      buffering=WRITE_BUFFER_SIZE) as csvfile:
+                writer = csv.writer(csvfile)
+                writer.writerow(self.column_names)
                 
-                self.logger.info(f"Conversion complete!")
-                self.logger.info(f"Total records: {self.total_records}")
-                self.logger.info(f"Valid records: {self.valid_records}")
-                self.logger.info(f"Invalid records: {self.invalid_records}")
-                if self.rows_skipped > 0:
-                    self.logger.info(f"Rows skipped: {self.rows_skipped}")
+                progress = tqdm(total=self.total_pages, desc="Processing pages", unit="page") if tqdm else None
                 
-                return self.total_records, self.valid_records
+                # --threads replaces worker processes, so --threads 1 runs inline
+                pool_size = min(parallelism, len(tasks))
+                executor: Optional[Executor] = None
+                if pool_size > 1:
+                    executor = ThreadPoolExecutor(pool_size) if self.threads else ProcessPoolExecutor(pool_size)
                 
+                if executor:
+                    with executor:
+                        # Two chunks per worker keep every worker busy
+                        results = self._run_tasks(executor, 2 * pool_size, tasks, chunks, progress)
+                        try:
+                            self._write_results(csvfile, writer, results)
+                        finally:
+                            # Cancels the queued chunks if writing failed
+                            results.close()
+                else:
+                    self._write_results(csvfile, writer, self._run_inline(tasks, chunks, progress))
+                
+                if progress:
+                    progress.close()
+            
+            self.logger.info("Conversion complete!")
+            self.logger.info("Total records: %d", self.total_records)
+            self.logger.info("Valid records: %d", self.valid_records)
+            self.logger.info("Invalid records: %d", self.invalid_records)
+            if self.rows_skipped > 0:
+                self.logger.info("Rows skipped: %d", self.rows_skipped)
+            
+            return self.total_records, self.valid_records
+            
         except Exception as e:
-            self.logger.error(f"Error during conversion: {e}")
+            self.logger.error("Error during conversion: %s", e)
             raise
 
 
+def _extract_text_fast(pdf_path: str, page_numbers: Sequence[int]) -> Iterator[str]:
+    """Extract plain text for the given 1-based pages with pdfminer directly
+    
+    Skips the char/line/rect objects pdfplumber builds for every page, which
+    the text-based methods never use.
+    """
+    if not page_numbers:
+        return
+    
+    resource_manager = PDFResourceManager()
+    output = io.StringIO()
+    device = TextConverter(resource_manager, output, laparams=LAParams(**FAST_TEXT_LAPARAMS))
+    interpreter = PDFPageInterpreter(resource_manager, device)
+    
+    try:
+        with open(pdf_path, 'rb') as fp:
+            pagenos = {page_number - 1 for page_number in page_numbers}
+            for page in PDFPage.get_pages(fp, pagenos=pagenos):
+                interpreter.process_page(page)
+                yield output.getvalue()
+                output.seek(0)
+                output.truncate()
+    finally:
+        device.close()
+
+
+def _process_chunk(task: tuple) -> ChunkResult:
+    """Process a chunk of pages; runs inline, on a thread or in a worker process"""
+    pdf_path, page_numbers, options, sampled_text = task
+    converter = PDFToCSVConverter(pdf_path, os.devnull, workers=1, **options)
+    converter._sampled_text = sampled_text
+    
+    rows = []
+    if converter.fast_text and converter.method != ExtractionMethod.TABLE:
+        skip_rows = converter.skip_rows
+        pending = [n for n in page_numbers if n not in sampled_text]
+        texts = _extract_text_fast(pdf_path, pending)
+        page_rows: List[List[Sequence[str]]] = []
+        fallback: Dict[int, int] = {}
+        for page_number in page_numbers:
+            text = sampled_text.pop(page_number, None)
+            if text is None:
+                text = next(texts)
+            page_text_rows = converter._rows_from_text(text)
+            if page_text_rows is None:
+                fallback[page_number] = len(page_rows)
+                page_text_rows = []
+            page_rows.append(page_text_rows)
+            
+            # Only skip rows on first page
+            converter.skip_rows = 0
+        
+        # Auto's table fallback needs pdfplumber; open it for those pages only
+        if fallback:
+            with pdfplumber.open(pdf_path, pages=list(fallback)) as pdf:
+                for page in pdf.pages:
+                    converter.skip_rows = skip_rows if page.page_number == page_numbers[0] else 0
+                    page_rows[fallback[page.page_number]] = list(
+                        converter.extract_table_data(page.extract_tables()))
+                    page.flush_cache()
+        
+        rows = list(chain.from_iterable(page_rows))
+    else:
+        with pdfplumber.open(pdf_path, pages=page_numbers) as pdf:
+            for page in pdf.pages:
+                rows.extend(converter.process_page(page))
+                page.flush_cache()
+                
+                # Only skip rows on first page
+                converter.skip_rows = 0
+    
+    # Release the batch's layout objects before the worker takes the next one
+    gc.collect()
+    
+    return rows, converter.valid_records, converter.invalid_records, converter.rows_skipped
+
+
 def main():
     """Command-line interface"""
     parser = argparse.ArgumentParser(
@@ -306,6 +597,10 @@ Examples:
                         type=str,
                         help='Comma-separated column names')
     
+    parser.add_argument('--pages',
+                        type=str,
+                        help='Pages to process, e.g. 1-50,100,200-250 (default: all)')
+    
     parser.add_argument('--skip',
                         type=int,
                         default=0,
@@ -315,6 +610,23 @@ Examples:
                         action='store_true',
                         help='Disable data validation')
     
+    parser.add_argument('-w', '--workers',
+                        type=int,
+                        help='Number of worker processes (default: CPU count)')
+    
+    parser.add_argument('--batch-size',
+                        type=int,
+                        default=DEFAULT_BATCH_SIZE,
+                        help=f'Pages processed per batch (default: {DEFAULT_BATCH_SIZE})')
+    
+    parser.add_argument('--threads',
+                        type=int,
+                        help='Process batches on N threads instead of worker processes')
+    
+    parser.add_argument('--fast-text',
+                        action='store_true',
+                        help='Extract text with pdfminer directly (text methods only)')
+    
     parser.add_argument('-v', '--verbose', 
                         action='store_true',
                         help='Enable verbose output')
@@ -325,6 +637,13 @@ Examples:
     
     args = parser.parse_args()
     
+    # Setup logging
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+    
     # Validate input
     if not Path(args.input).exists():
         print(f"Error: Input file '{args.input}' not found")
@@ -335,6 +654,15 @@ Examples:
     if args.columns:
         column_names = [col.strip() for col in args.columns.split(',')]
     
+    # Parse page selection
+    pages = None
+    if args.pages:
+        try:
+            pages = parse_page_ranges(args.pages)
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+    
     # Run conversion
     try:
         converter = PDFToCSVConverter(
@@ -346,7 +674,12 @@ Examples:
             interactive=args.interactive,
             column_names=column_names,
             num_columns=args.num_columns,
-            skip_rows=args.skip
+            skip_rows=args.skip,
+            workers=args.workers or os.cpu_count() or 1,
+            batch_size=args.batch_size,
+            fast_text=args.fast_text,
+            threads=args.threads,
+            pages=pages
         )
         
         total, valid = converter.convert()
@@ -0,0 +1,112 @@
+import csv
+import io
+import random
+
+import pytest
+
+from pdf_to_csv_converter import ExtractionMethod, PDFToCSVConverter, format_plain_rows, parse_page_ranges
+
+
+def csv_writer_text(rows):
+    output = io.StringIO()
+    csv.writer(output).writerows(rows)
+    return output.getvalue()
+
+
+class TestParsePageRanges:
+    def test_single_pages_and_ranges(self):
+        assert parse_page_ranges('1-50,100,200-250') == [range(1, 51), range(100, 101), range(200, 251)]
+
+    def test_overlapping_and_adjacent_ranges_are_merged(self):
+        assert parse_page_ranges('7, 3,1-2,2-5') == [range(1, 6), range(7, 8)]
+
+    def test_wide_range_is_not_expanded(self):
+        assert parse_page_ranges('1-999999999') == [range(1, 1000000000)]
+
+    @pytest.mark.parametrize('spec', ['0', '5-3', 'a', '1-b', '-4'])
+    def test_invalid_range(self, spec):
+        with pytest.raises(ValueError, match='Invalid page range'):
+            parse_page_ranges(spec)
+
+    @pytest.mark.parametrize('spec', ['', ' , '])
+    def test_empty_selection(self, spec):
+        with pytest.raises(ValueError, match='No pages selected'):
+            parse_page_ranges(spec)
+
+
+class TestFormatPlainRows:
+    def test_plain_rows_match_csv_writer(self):
+        rows = [('1', 'Ali', '20'), ('2', 'Omar', '30')]
+        assert format_plain_rows(rows, 3) == csv_writer_text(rows)
+
+    def test_empty_fields_match_csv_writer(self):
+        rows = [('', '', 'c'), ('a', '', '')]
+        assert format_plain_rows(rows, 3) == csv_writer_text(rows)
+
+    def test_no_rows(self):
+        assert format_plain_rows([], 3) == ''
+
+    @pytest.mark.parametrize('field', ['a,b', 'say "hi"', 'a\rb', 'a\nb', 'a\r\nb', '"'])
+    def test_fields_needing_quotes_fall_back_to_csv_writer(self, field):
+        assert format_plain_rows([('1', field, '3'), ('x', 'y', 'z')], 3) is None
+
+    def test_random_rows_match_csv_writer(self):
+        rng = random.Random(0)
+        alphabet = ['a', 'b', '1', ' ', ' ', ',', '"', '\r', '\n']
+        for _ in range(2000):
+            num_columns = rng.randint(2, 4)
+            rows = [tuple(''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 2)))
+                          for _ in range(num_columns))
+                    for _ in range(rng.randint(1, 4))]
+            text = format_plain_rows(rows, num_columns)
+            assert text is None or text == csv_writer_text(rows)
+
+    def test_single_column_falls_back(self):
+        assert format_plain_rows([('',), ('a',)], 1) is None
+
+
+class StubPage:
+    """Stands in for a pdfplumber page"""
+
+    def __init__(self, text, tables):
+        self.page_number = 1
+        self.text = text
+        self.tables = tables
+        self.tables_extracted = False
+
+    def extract_text(self):
+        return self.text
+
+    def extract_tables(self):
+        self.tables_extracted = True
+        return self.tables
+
+
+class TestAutoTableFallback:
+    TABLE = [['ID', 'Name', 'Age'], ['1', 'Ali', '20'], ['2', '', '30']]
+
+    def test_text_rows_skip_the_table_parse(self):
+        converter = PDFToCSVConverter('in.pdf', 'out.csv')
+        page = StubPage('1 Ali 20 2 Omar 30', [self.TABLE])
+        assert list(converter.process_page(page)) == [('1', 'Ali', '20'), ('2', 'Omar', '30')]
+        assert not page.tables_extracted
+
+    def test_fallback_counts_only_the_table_pass(self):
+        converter = PDFToCSVConverter('in.pdf', 'out.csv', skip_rows=1)
+        page = StubPage('Title', [self.TABLE])
+        assert list(converter.process_page(page)) == [['1', 'Ali', '20']]
+        assert page.tables_extracted
+        assert (converter.rows_skipped, converter.valid_records, converter.invalid_records) == (1, 1, 1)
+
+    def test_fallback_discards_invalid_text_rows(self):
+        converter = PDFToCSVConverter('in.pdf', 'out.csv', row_validator=lambda values: False)
+        page = StubPage('a b c', [])
+        assert list(converter.process_page(page)) == []
+        assert page.tables_extracted
+        assert (converter.valid_records, converter.invalid_records) == (0, 0)
+
+    def test_structured_method_never_falls_back(self):
+        converter = PDFToCSVConverter('in.pdf', 'out.csv', method=ExtractionMethod.STRUCTURED)
+        page = StubPage('Title', [self.TABLE])
+        assert list(converter.process_page(page)) == []
+        assert not page.tables_extracted